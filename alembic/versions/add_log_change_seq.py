@@ -0,0 +1,72 @@
+"""add log change sequence and tombstones
+
+Revision ID: add_log_change_seq
+Revises: add_log_events_table
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+revision = 'add_log_change_seq'
+down_revision = 'add_log_events_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    logger.info("Starting upgrade: adding log change sequence")
+    op.execute('ALTER TABLE logs ADD COLUMN change_seq INTEGER')
+
+    # backfill existing logs in id order, then make the column required
+    op.execute('''
+        UPDATE logs SET change_seq = numbered.seq
+        FROM (SELECT id, ROW_NUMBER() OVER (ORDER BY id) AS seq FROM logs) AS numbered
+        WHERE logs.id = numbered.id
+    ''')
+    op.execute('ALTER TABLE logs ALTER COLUMN change_seq SET NOT NULL')
+    logger.info("Added and backfilled change_seq column")
+
+    # single counter row; bumping it locks the row until commit, so values follow commit order
+    op.create_table(
+        'log_change_counter',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('value', sa.Integer(), nullable=False),
+    )
+    op.execute('INSERT INTO log_change_counter (id, value) SELECT 1, COALESCE(MAX(change_seq), 0) FROM logs')
+    logger.info("Created log_change_counter table")
+
+    op.create_index('ix_logs_change_seq', 'logs', ['change_seq'])
+    op.create_index('ix_logs_user_id_change_seq', 'logs', ['user_id', 'change_seq'])
+    logger.info("Created change_seq indexes")
+
+    op.create_table(
+        'log_tombstones',
+        sa.Column('log_id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('change_seq', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_log_tombstones_change_seq', 'log_tombstones', ['change_seq'])
+    op.create_index('ix_log_tombstones_user_id_change_seq', 'log_tombstones', ['user_id', 'change_seq'])
+    logger.info("Created log_tombstones table")
+
+
+def downgrade() -> None:
+    logger.info("Starting downgrade: removing log change sequence")
+    op.drop_index('ix_log_tombstones_user_id_change_seq', table_name='log_tombstones')
+    op.drop_index('ix_log_tombstones_change_seq', table_name='log_tombstones')
+    op.drop_table('log_tombstones')
+    logger.info("Dropped log_tombstones table")
+
+    op.drop_table('log_change_counter')
+    logger.info("Dropped log_change_counter table")
+
+    op.drop_index('ix_logs_user_id_change_seq', table_name='logs')
+    op.drop_index('ix_logs_change_seq', table_name='logs')
+    op.execute('ALTER TABLE logs DROP COLUMN IF EXISTS change_seq')
+    logger.info("Dropped change_seq column")
@@ -0,0 +1,42 @@
+"""add log_events table
+
+Revision ID: add_log_events_table
+Revises: add_username_field
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+revision = 'add_log_events_table'
+down_revision = 'add_username_field'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    logger.info("Starting upgrade: creating log_events table")
+    op.create_table(
+        'log_events',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('log_id', sa.Integer(), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=True),
+        sa.Column('action', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_log_events_id', 'log_events', ['id'])
+    op.create_index('ix_log_events_log_id', 'log_events', ['log_id'])
+    logger.info("Created log_events table")
+
+
+def downgrade() -> None:
+    logger.info("Starting downgrade: dropping log_events table")
+    op.drop_index('ix_log_events_log_id', table_name='log_events')
+    op.drop_index('ix_log_events_id', table_name='log_events')
+    op.drop_table('log_events')
+    logger.info("Dropped log_events table")
@@ -0,0 +1,126 @@
+import os
+import logging
+import threading
+from datetime import datetime
+from dotenv import load_dotenv
+from sqlalchemy import insert
+
+from . import models
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# flush when this many events are pending, or after this many milliseconds
+AUDIT_FLUSH_BATCH_SIZE = int(os.getenv("AUDIT_FLUSH_BATCH_SIZE", "100"))
+AUDIT_FLUSH_INTERVAL_MS = int(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "1000"))
+# most events kept in memory while the database is unreachable
+AUDIT_MAX_PENDING = int(os.getenv("AUDIT_MAX_PENDING", "10000"))
+
+
+class AuditBuffer:
+    """Write-behind buffer for log audit events.
+
+    record() only appends to an in-memory list; a background thread writes
+    the pending events to log_events in one multi-row INSERT per batch.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = AUDIT_FLUSH_BATCH_SIZE,
+        interval_ms: int = AUDIT_FLUSH_INTERVAL_MS,
+        max_pending: int = AUDIT_MAX_PENDING
+    ):
+        self.batch_size = batch_size
+        self.interval = interval_ms / 1000
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending = []
+        self._last_flush_failed = False
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._stopping = False
+        self._thread = None
+
+    def record(self, log_id: int, action: str, actor_id: int | None = None, status: str | None = None):
+        event = {
+            "log_id": log_id,
+            "actor_id": actor_id,
+            "action": action,
+            "status": status,
+            "created_at": datetime.utcnow(),
+        }
+        with self._cond:
+            self._pending.append(event)
+            self._trim()
+            # while the database is failing, leave retries to the worker's interval
+            if len(self._pending) >= self.batch_size and not self._last_flush_failed:
+                self._cond.notify()
+
+    def flush(self):
+        # the flush lock keeps batches in order when a request flushes alongside the worker
+        with self._flush_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            db = SessionLocal()
+            try:
+                db.execute(insert(models.LogEvent).values(batch))
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to write {len(batch)} audit events, will retry: {str(e)}")
+                self._requeue(batch)
+                self._last_flush_failed = True
+                return 0
+            finally:
+                db.close()
+            self._last_flush_failed = False
+            return len(batch)
+
+    def _requeue(self, batch):
+        # put the failed batch back in front of newer events
+        with self._cond:
+            self._pending = batch + self._pending
+            self._trim()
+
+    def _trim(self):
+        # past the cap, drop the oldest events; caller holds self._cond
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.dropped += overflow
+            logger.error(f"Audit buffer full, dropped {overflow} oldest events ({self.dropped} in total)")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        # wake the worker, wait for it to exit, then drain anything left over
+        if self._thread is not None:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # after a failed flush, back off for a full interval before retrying
+                if not self._stopping and (self._last_flush_failed or len(self._pending) < self.batch_size):
+                    self._cond.wait(self.interval)
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+
+audit_buffer = AuditBuffer()
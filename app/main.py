@@ -4,6 +4,7 @@ from .routers import users, logs
 from fastapi.middleware.cors import CORSMiddleware
 from app import models
 from app.database import engine
+from app.audit import audit_buffer
 
 app = FastAPI()
 
@@ -23,6 +24,15 @@ app.add_middleware(
 def read_root():
     return {"message": "FastAPI backend is working ✅"}
 
+@app.on_event("startup")
+def start_audit_buffer():
+    audit_buffer.start()
+
+@app.on_event("shutdown")
+def drain_audit_buffer():
+    # flush any pending audit events before the process exits
+    audit_buffer.stop()
+
 app.include_router(users.router)
 app.include_router(logs.router)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date, Float
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date, Float, DateTime, Index, DDL, event, update
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -21,3 +21,64 @@ class Log(Base):
     task_description = Column(String, nullable=True)
     status = Column(String, default="pending")  # pending / approved / rejected
     reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Who reviewed
+    change_seq = Column(Integer, nullable=False, index=True)  # bumped on every insert/update
+
+    __table_args__ = (
+        Index("ix_logs_user_id_change_seq", "user_id", "change_seq"),
+    )
+
+class LogTombstone(Base):
+    __tablename__ = 'log_tombstones'
+    # Left behind by deleted logs so syncing clients can drop them
+    log_id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    change_seq = Column(Integer, nullable=False, index=True)
+    deleted_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_log_tombstones_user_id_change_seq", "user_id", "change_seq"),
+    )
+
+class LogEvent(Base):
+    __tablename__ = 'log_events'
+    # Append-only audit trail; no foreign keys so history outlives deleted logs/users
+    id = Column(Integer, primary_key=True, index=True)
+    log_id = Column(Integer, nullable=False, index=True)
+    actor_id = Column(Integer, nullable=True)
+    action = Column(String, nullable=False)  # create / edit / approve / reject / delete
+    status = Column(String, nullable=True)   # log status after the event
+    created_at = Column(DateTime, nullable=False)
+
+class LogChangeCounter(Base):
+    __tablename__ = 'log_change_counter'
+    # Single row handing out change_seq values for logs and log_tombstones
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False)
+
+event.listen(
+    LogChangeCounter.__table__,
+    "after_create",
+    DDL("INSERT INTO log_change_counter (id, value) VALUES (1, 0)")
+)
+
+def next_change_seq(connection):
+    """Take the next change sequence value inside the current transaction.
+
+    Bumping the counter row locks it until commit, so concurrent writers get
+    their values in commit order. A database sequence would not: a writer
+    could take 10, commit after another writer's 11, and be skipped by any
+    client that already synced up to 11.
+    """
+    counter = LogChangeCounter.__table__
+    return connection.execute(
+        update(counter)
+        .where(counter.c.id == 1)
+        .values(value=counter.c.value + 1)
+        .returning(counter.c.value)
+    ).scalar_one()
+
+@event.listens_for(Log, "before_insert")
+@event.listens_for(Log, "before_update")
+@event.listens_for(LogTombstone, "before_insert")
+def assign_change_seq(mapper, connection, target):
+    target.change_seq = next_change_seq(connection)
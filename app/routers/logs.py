@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
+import base64
+import binascii
 
 from .. import models, schemas, auth
+from ..audit import audit_buffer
 from ..database import get_db
 
 router = APIRouter(
@@ -24,9 +27,12 @@ def create_log(log: schemas.LogCreate, db: Session = Depends(get_db), current_us
         status=log.status,  # 🔥 pass in the status
         reviewer_id=log.reviewer_id  # 🔥 pass in the reviewer_id
     )
+    # read before commit: the commit expires current_user and .id would reload it
+    actor_id = current_user.id
     db.add(db_log)
     db.commit()
     db.refresh(db_log)
+    audit_buffer.record(db_log.id, "create", actor_id=actor_id, status=db_log.status)
     return db_log
 
 # get all logs
@@ -35,6 +41,65 @@ def get_my_logs(db: Session = Depends(get_db), current_user: models.User = Depen
     logs = db.query(models.Log).filter(models.Log.user_id == current_user.id).all()
     return logs
 
+def encode_cursor(change_seq: int) -> str:
+    return base64.urlsafe_b64encode(f"v1:{change_seq}".encode()).decode()
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        version, change_seq = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        if version != "v1":
+            raise ValueError(version)
+        return int(change_seq)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync cursor"
+        )
+
+# get logs changed since a cursor (omit `since` for a full sync)
+@router.get("/changes", response_model=schemas.LogChanges)
+def get_log_changes(
+    since: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user)
+):
+    since_seq = decode_cursor(since) if since else 0
+    # change_seq values are handed out in commit order (see models.next_change_seq),
+    # so every change up to the committed counter value is already visible.
+    # Bounding both queries by it keeps later commits out of this page and
+    # makes it a safe cursor.
+    latest_seq = db.query(models.LogChangeCounter.value).filter(models.LogChangeCounter.id == 1).scalar()
+    if since_seq > latest_seq:
+        # the counter was reset (restore or re-initialized database); the
+        # client's copy can't be patched up, it has to sync from scratch
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync cursor is ahead of the server; do a full sync"
+        )
+
+    logs_query = db.query(models.Log).filter(
+        models.Log.change_seq > since_seq,
+        models.Log.change_seq <= latest_seq
+    )
+    tombstones_query = db.query(models.LogTombstone).filter(
+        models.LogTombstone.change_seq > since_seq,
+        models.LogTombstone.change_seq <= latest_seq
+    )
+    # Supervisors review everyone's logs; interns only sync their own
+    if current_user.role not in ["supervisor", "admin"]:
+        logs_query = logs_query.filter(models.Log.user_id == current_user.id)
+        tombstones_query = tombstones_query.filter(models.LogTombstone.user_id == current_user.id)
+
+    logs = logs_query.order_by(models.Log.change_seq).all()
+    # a full sync has nothing to delete on the client
+    tombstones = tombstones_query.all() if since else []
+
+    return {
+        "logs": logs,
+        "deleted": [t.log_id for t in tombstones],
+        "cursor": encode_cursor(latest_seq)
+    }
+
 @router.put("/{log_id}", response_model=schemas.LogResponse)
 def update_log(
     log_id: int,
@@ -81,11 +146,93 @@ def update_log(
         if update_data.get('date'):
             update_data['date'] = datetime.strptime(update_data['date'], '%Y-%m-%d').date()
 
-    # Update the log
+    # Update the log, keeping track of what actually changed
+    changed = set()
     for key, value in update_data.items():
-        if value is not None:
+        if value is not None and getattr(db_log, key) != value:
             setattr(db_log, key, value)
+            changed.add(key)
 
+    if not changed:
+        return db_log
+
+    actor_id = current_user.id  # read before commit expires current_user
     db.commit()
     db.refresh(db_log)
+
+    # Record the audit event; written to log_events in the background
+    if "status" in changed:
+        action = {"approved": "approve", "rejected": "reject"}.get(log_update.status, "edit")
+    else:
+        action = "edit"
+    audit_buffer.record(db_log.id, action, actor_id=actor_id, status=db_log.status)
     return db_log
+
+# delete a log (owner only)
+@router.delete("/{log_id}")
+def delete_log(
+    log_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user)
+):
+    db_log = db.query(models.Log).filter(models.Log.id == log_id).first()
+    if not db_log:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Log not found"
+        )
+    if db_log.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this log"
+        )
+
+    # Leave a tombstone so syncing clients learn about the deletion
+    db.add(models.LogTombstone(
+        log_id=db_log.id,
+        user_id=db_log.user_id,
+        deleted_at=datetime.utcnow()
+    ))
+    db.delete(db_log)
+    actor_id = current_user.id  # read before commit expires current_user
+    db.commit()
+    audit_buffer.record(log_id, "delete", actor_id=actor_id)
+    return {"message": "Log deleted successfully"}
+
+# get the audit history of a log
+@router.get("/{log_id}/history", response_model=List[schemas.LogEventResponse])
+def get_log_history(
+    log_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user)
+):
+    db_log = db.query(models.Log).filter(models.Log.id == log_id).first()
+    if db_log:
+        owner_id = db_log.user_id
+    else:
+        # History outlives the log; a deleted log's tombstone still knows its owner
+        tombstone = db.query(models.LogTombstone).filter(models.LogTombstone.log_id == log_id).first()
+        if not tombstone:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Log not found"
+            )
+        owner_id = tombstone.user_id
+
+    is_owner = owner_id == current_user.id
+    is_supervisor = current_user.role in ["supervisor", "admin"]
+    if not (is_owner or is_supervisor):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this log"
+        )
+
+    # Write out buffered events so the history is complete
+    audit_buffer.flush()
+    events = (
+        db.query(models.LogEvent)
+        .filter(models.LogEvent.log_id == log_id)
+        .order_by(models.LogEvent.created_at, models.LogEvent.id)
+        .all()
+    )
+    return events
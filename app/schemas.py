@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field # <- pydantic is a library for data validation and settings management
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, List
 
 class UserCreate(BaseModel):
@@ -71,6 +71,22 @@ class LogUpdate(BaseModel):
             date: lambda v: v.isoformat() if v else None
         }
 
+class LogEventResponse(BaseModel):
+    id: int
+    log_id: int
+    actor_id: Optional[int] = None
+    action: str
+    status: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class LogChanges(BaseModel):
+    logs: List[LogResponse]  # created, edited or reviewed since the cursor
+    deleted: List[int]       # ids of logs deleted since the cursor
+    cursor: str              # pass back as `since` on the next sync
+
 class UserUpdate(BaseModel):
     email: Optional[EmailStr] = None
     role: Optional[str] = None
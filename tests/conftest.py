@@ -0,0 +1,189 @@
+import os
+import time
+import tempfile
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+
+# Point the app at a throwaway SQLite database before anything imports app.database
+_db_dir = tempfile.mkdtemp(prefix="iswl_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app import models, auth
+from app.audit import audit_buffer
+from app.database import engine, SessionLocal
+from app.main import app
+
+PASSWORD = "password123"
+# bcrypt is slow on purpose; hash once and reuse it for every seeded user
+HASHED_PASSWORD = auth.get_password_hash(PASSWORD)
+
+
+class QueryCounter:
+    """Counts SQL statements and fetched rows on the app engine while active."""
+
+    def __init__(self):
+        self.active = False
+        self.statements = []
+        self.rows = 0
+
+    def reset(self):
+        self.statements = []
+        self.rows = 0
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active:
+            self.statements.append(statement)
+
+    def row_factory(self, cursor, row):
+        # sqlite3 calls this once for every row handed back to SQLAlchemy
+        if self.active:
+            self.rows += 1
+        return row
+
+    def on_connect(self, dbapi_connection, connection_record):
+        dbapi_connection.row_factory = self.row_factory
+
+
+query_counter = QueryCounter()
+event.listen(engine, "before_cursor_execute", query_counter.before_cursor_execute)
+event.listen(engine, "connect", query_counter.on_connect)
+# drop connections opened at import time so every pooled connection counts rows
+engine.dispose()
+
+
+class BudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def measure():
+    """Measure the SQL statements, rows and wall time of the enclosed block."""
+    result = {}
+    query_counter.reset()
+    query_counter.active = True
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        query_counter.active = False
+        result["statements"] = len(query_counter.statements)
+        result["rows"] = query_counter.rows
+        result["ms"] = elapsed_ms
+        result["sql"] = list(query_counter.statements)
+
+
+@contextmanager
+def query_budget(statements: int, rows: int, ms: float):
+    """Fail if the enclosed block exceeds its wall time budget or its statement
+    and row counts differ from the budget; a lower count means the budget is stale."""
+    with measure() as result:
+        yield result
+    problems = []
+    if result["statements"] != statements:
+        problems.append(f"{result['statements']} statements (budget {statements})")
+    if result["rows"] != rows:
+        problems.append(f"{result['rows']} rows fetched (budget {rows})")
+    if result["ms"] > ms:
+        problems.append(f"{result['ms']:.0f} ms (budget {ms:.0f} ms)")
+    if problems:
+        sql = "\n  ".join(result["sql"])
+        raise BudgetExceeded(", ".join(problems) + f"\nStatements:\n  {sql}")
+
+
+@pytest.fixture(autouse=True)
+def fresh_db():
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    yield
+    audit_buffer.flush()
+
+
+@pytest.fixture
+def client():
+    # No context manager: startup hooks stay off, so the audit flusher thread
+    # never runs SQL that would be counted against a request.
+    return TestClient(app)
+
+
+@pytest.fixture
+def seed():
+    seeder = Seeder()
+    yield seeder
+    seeder.db.close()
+
+
+@pytest.fixture(name="measure")
+def measure_fixture():
+    return measure
+
+
+@pytest.fixture(name="query_budget")
+def query_budget_fixture():
+    return query_budget
+
+
+class Seeder:
+    """Inserts users and logs directly, bypassing the API."""
+
+    password = PASSWORD
+
+    def __init__(self):
+        # keep seeded objects readable without lazy loads during measurement
+        self.db = SessionLocal(expire_on_commit=False)
+
+    def user(self, username: str, role: str = "intern"):
+        user = models.User(
+            email=f"{username}@example.com",
+            username=username,
+            hashed_password=HASHED_PASSWORD,
+            role=role
+        )
+        self.db.add(user)
+        self.db.commit()
+        self.db.refresh(user)
+        return user
+
+    def users(self, count: int, role: str = "intern", prefix: str = "user"):
+        users = [
+            models.User(
+                email=f"{prefix}{i}@example.com",
+                username=f"{prefix}{i}",
+                hashed_password=HASHED_PASSWORD,
+                role=role
+            )
+            for i in range(count)
+        ]
+        self.db.add_all(users)
+        self.db.commit()
+        return users
+
+    def logs(self, user: models.User, count: int):
+        logs = [
+            models.Log(
+                user_id=user.id,
+                week_number=i // 5 + 1,
+                day="Monday",
+                date=date(2024, 3, 18),
+                working_hours=8.0,
+                task_description=f"Task {i}",
+                status="pending"
+            )
+            for i in range(count)
+        ]
+        self.db.add_all(logs)
+        self.db.commit()
+        return logs
+
+    @staticmethod
+    def headers(user: models.User):
+        token = auth.create_access_token(data={"sub": user.email, "role": user.role})
+        return {"Authorization": f"Bearer {token}"}
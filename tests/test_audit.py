@@ -0,0 +1,219 @@
+"""Behavior of the write-behind audit buffer and the log history endpoint."""
+import time
+
+import pytest
+
+from app import models
+from app.audit import AuditBuffer
+from app.database import SessionLocal, engine
+
+LOG_PAYLOAD = {
+    "day": "Monday",
+    "date": "2024-03-18",
+    "week_number": 1,
+    "working_hours": 8,
+    "task_description": "Completed feature X",
+    "status": "pending",
+}
+
+
+def count_events():
+    db = SessionLocal()
+    try:
+        return db.query(models.LogEvent).count()
+    finally:
+        db.close()
+
+
+def wait_for_events(expected, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if count_events() >= expected:
+            break
+        time.sleep(0.01)
+    return count_events()
+
+
+@pytest.fixture
+def buffers():
+    created = []
+
+    def make(**kwargs):
+        buffer = AuditBuffer(**kwargs)
+        created.append(buffer)
+        return buffer
+
+    yield make
+    for buffer in created:
+        buffer.stop()
+
+
+# ============ AuditBuffer ============
+
+def test_flushes_when_batch_size_is_reached(buffers):
+    buffer = buffers(batch_size=3, interval_ms=60_000)
+    buffer.start()
+    buffer.record(1, "create", actor_id=1, status="pending")
+    buffer.record(1, "edit", actor_id=1, status="pending")
+    time.sleep(0.1)
+    assert count_events() == 0
+
+    buffer.record(1, "approve", actor_id=2, status="approved")
+    assert wait_for_events(3) == 3
+
+
+def test_flushes_after_interval(buffers):
+    buffer = buffers(batch_size=3, interval_ms=50)
+    buffer.start()
+    buffer.record(1, "create", actor_id=1, status="pending")
+    assert wait_for_events(1) == 1
+
+
+def test_stop_drains_pending_events(buffers):
+    buffer = buffers(batch_size=3, interval_ms=60_000)
+    buffer.start()
+    buffer.record(1, "create", actor_id=1, status="pending")
+    buffer.record(1, "edit", actor_id=1, status="pending")
+    buffer.stop()
+    assert count_events() == 2
+
+
+def test_failed_flush_is_retried(buffers):
+    buffer = buffers(batch_size=3, interval_ms=50)
+    buffer.record(1, "create", actor_id=1, status="pending")
+    buffer.record(1, "edit", actor_id=1, status="pending")
+
+    models.LogEvent.__table__.drop(bind=engine)
+    assert buffer.flush() == 0
+    models.LogEvent.__table__.create(bind=engine)
+
+    assert buffer.flush() == 2
+    db = SessionLocal()
+    try:
+        actions = [e.action for e in db.query(models.LogEvent).order_by(models.LogEvent.id)]
+    finally:
+        db.close()
+    assert actions == ["create", "edit"]
+
+
+def test_failed_flush_backs_off_for_interval(buffers):
+    buffer = buffers(batch_size=2, interval_ms=60_000)
+    attempts = []
+    flush = buffer.flush
+    buffer.flush = lambda: attempts.append(1) or flush()
+
+    models.LogEvent.__table__.drop(bind=engine)
+    buffer.start()
+    buffer.record(1, "create", actor_id=1)
+    buffer.record(1, "edit", actor_id=1)
+    deadline = time.monotonic() + 2
+    while not attempts and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(attempts) == 1
+
+    # new events during the outage must not trigger more write attempts
+    for _ in range(5):
+        buffer.record(1, "edit", actor_id=1)
+    time.sleep(0.3)
+    assert len(attempts) == 1
+
+    models.LogEvent.__table__.create(bind=engine)
+    buffer.stop()
+    assert count_events() == 7
+
+
+def test_failed_flush_drops_oldest_past_cap(buffers):
+    buffer = buffers(batch_size=3, interval_ms=50, max_pending=2)
+    for action in ("create", "edit", "approve"):
+        buffer.record(1, action, actor_id=1)
+
+    models.LogEvent.__table__.drop(bind=engine)
+    buffer.flush()
+    models.LogEvent.__table__.create(bind=engine)
+
+    assert buffer.dropped == 1
+    assert buffer.flush() == 2
+
+
+def test_record_drops_oldest_past_cap(buffers):
+    buffer = buffers(batch_size=10, interval_ms=60_000, max_pending=2)
+    for action in ("create", "edit", "approve"):
+        buffer.record(1, action, actor_id=1)
+
+    assert buffer.dropped == 1
+    assert buffer.flush() == 2
+    db = SessionLocal()
+    try:
+        actions = [e.action for e in db.query(models.LogEvent).order_by(models.LogEvent.id)]
+    finally:
+        db.close()
+    assert actions == ["edit", "approve"]
+
+
+# ============ GET /logs/{log_id}/history ============
+
+def test_history_records_create_edit_approve_reject(client, seed):
+    intern = seed.user("intern")
+    supervisor = seed.user("supervisor", role="supervisor")
+    intern_headers = seed.headers(intern)
+    supervisor_headers = seed.headers(supervisor)
+
+    log_id = client.post("/logs/", json=LOG_PAYLOAD, headers=intern_headers).json()["id"]
+    client.put(f"/logs/{log_id}", json={"task_description": "Updated"}, headers=intern_headers)
+    client.put(f"/logs/{log_id}", json={"status": "approved"}, headers=supervisor_headers)
+    client.put(f"/logs/{log_id}", json={"status": "rejected"}, headers=supervisor_headers)
+
+    response = client.get(f"/logs/{log_id}/history", headers=intern_headers)
+    assert response.status_code == 200
+    events = response.json()
+    assert [e["action"] for e in events] == ["create", "edit", "approve", "reject"]
+    assert [e["actor_id"] for e in events] == [intern.id, intern.id, supervisor.id, supervisor.id]
+    assert [e["status"] for e in events] == ["pending", "pending", "approved", "rejected"]
+
+
+def test_history_skips_updates_that_change_nothing(client, seed):
+    intern = seed.user("intern")
+    supervisor = seed.user("supervisor", role="supervisor")
+    intern_headers = seed.headers(intern)
+    supervisor_headers = seed.headers(supervisor)
+    log = seed.logs(intern, 1)[0]
+
+    client.put(f"/logs/{log.id}", json={"status": "rejected"}, headers=supervisor_headers)
+    # no status change: must not record a second reject
+    client.put(f"/logs/{log.id}", json={"task_description": "Ignored"}, headers=supervisor_headers)
+    client.put(f"/logs/{log.id}", json={"status": "rejected"}, headers=supervisor_headers)
+    client.put(f"/logs/{log.id}", json={}, headers=intern_headers)
+
+    events = client.get(f"/logs/{log.id}/history", headers=intern_headers).json()
+    assert [e["action"] for e in events] == ["reject"]
+
+
+def test_history_forbidden_for_other_interns(client, seed):
+    owner = seed.user("owner")
+    other = seed.user("other")
+    log = seed.logs(owner, 1)[0]
+    response = client.get(f"/logs/{log.id}/history", headers=seed.headers(other))
+    assert response.status_code == 403
+
+
+def test_history_of_deleted_log(client, seed):
+    owner = seed.user("owner")
+    other = seed.user("other")
+    supervisor = seed.user("supervisor", role="supervisor")
+    headers = seed.headers(owner)
+    log_id = client.post("/logs/", json=LOG_PAYLOAD, headers=headers).json()["id"]
+    client.delete(f"/logs/{log_id}", headers=headers)
+
+    for user in (owner, supervisor):
+        response = client.get(f"/logs/{log_id}/history", headers=seed.headers(user))
+        assert response.status_code == 200
+        assert [e["action"] for e in response.json()] == ["create", "delete"]
+
+    response = client.get(f"/logs/{log_id}/history", headers=seed.headers(other))
+    assert response.status_code == 403
+
+
+def test_history_of_unknown_log(client, seed):
+    supervisor = seed.user("supervisor", role="supervisor")
+    response = client.get("/logs/999/history", headers=seed.headers(supervisor))
+    assert response.status_code == 404
@@ -0,0 +1,170 @@
+"""Behavior of the delta sync endpoint GET /logs/changes."""
+import threading
+import time
+
+from app import models
+from app.database import SessionLocal, engine
+
+
+def sync(client, headers, cursor=None):
+    params = {"since": cursor} if cursor is not None else {}
+    response = client.get("/logs/changes", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_concurrent_writers_get_change_seq_in_commit_order(client, seed):
+    # Writer A takes its change_seq first but commits last. B must not be
+    # able to commit a higher change_seq in between; otherwise a client
+    # syncing at that moment would move its cursor past A and never see it.
+    intern = seed.user("intern")
+    supervisor = seed.user("supervisor", role="supervisor")
+    headers = seed.headers(supervisor)
+    log_a, log_b = seed.logs(intern, 2)
+    cursor = sync(client, headers)["cursor"]
+
+    session_a = SessionLocal()
+    session_a.get(models.Log, log_a.id).task_description = "Edited by A"
+    session_a.flush()  # change_seq taken, transaction still open
+
+    b_committed = threading.Event()
+
+    def writer_b():
+        session_b = SessionLocal()
+        try:
+            session_b.get(models.Log, log_b.id).task_description = "Edited by B"
+            session_b.commit()
+            b_committed.set()
+        finally:
+            session_b.close()
+
+    thread = threading.Thread(target=writer_b)
+    thread.start()
+    time.sleep(0.2)
+    assert not b_committed.is_set(), "B committed while A still held its change_seq"
+
+    # a client syncing now sees neither write, and keeps its cursor
+    midway = sync(client, headers, cursor)
+    assert midway["logs"] == []
+    assert midway["cursor"] == cursor
+
+    session_a.commit()
+    session_a.close()
+    thread.join(timeout=5)
+    assert b_committed.is_set()
+
+    changes = sync(client, headers, midway["cursor"])
+    assert [log["id"] for log in changes["logs"]] == [log_a.id, log_b.id]
+
+
+def test_edit_after_cursor_is_returned(client, seed):
+    intern = seed.user("intern")
+    headers = seed.headers(intern)
+    edited, untouched = seed.logs(intern, 2)
+    cursor = sync(client, headers)["cursor"]
+
+    client.put(f"/logs/{edited.id}", json={"task_description": "Updated"}, headers=headers)
+
+    changes = sync(client, headers, cursor)
+    assert [log["id"] for log in changes["logs"]] == [edited.id]
+    assert changes["logs"][0]["task_description"] == "Updated"
+    assert changes["deleted"] == []
+    assert changes["cursor"] != cursor
+
+    # nothing new since the returned cursor
+    assert sync(client, headers, changes["cursor"])["logs"] == []
+
+
+def test_supervisor_review_bumps_log_into_changes(client, seed):
+    intern = seed.user("intern")
+    supervisor = seed.user("supervisor", role="supervisor")
+    intern_headers = seed.headers(intern)
+    log = seed.logs(intern, 1)[0]
+    intern_cursor = sync(client, intern_headers)["cursor"]
+    supervisor_cursor = sync(client, seed.headers(supervisor))["cursor"]
+
+    client.put(f"/logs/{log.id}", json={"status": "approved"}, headers=seed.headers(supervisor))
+
+    for headers, cursor in ((intern_headers, intern_cursor), (seed.headers(supervisor), supervisor_cursor)):
+        changes = sync(client, headers, cursor)
+        assert [l["id"] for l in changes["logs"]] == [log.id]
+        assert changes["logs"][0]["status"] == "approved"
+        assert changes["logs"][0]["reviewer_id"] == supervisor.id
+
+
+def test_intern_does_not_see_other_interns_changes(client, seed):
+    intern = seed.user("intern")
+    other = seed.user("other")
+    headers = seed.headers(intern)
+    other_headers = seed.headers(other)
+    own_log = seed.logs(intern, 1)[0]
+    other_logs = seed.logs(other, 2)
+    cursor = sync(client, headers)["cursor"]
+
+    client.put(f"/logs/{other_logs[0].id}", json={"task_description": "Updated"}, headers=other_headers)
+    client.delete(f"/logs/{other_logs[1].id}", headers=other_headers)
+
+    full = sync(client, headers)
+    assert [log["id"] for log in full["logs"]] == [own_log.id]
+    changes = sync(client, headers, cursor)
+    assert changes["logs"] == []
+    assert changes["deleted"] == []
+
+
+def test_invalid_cursor_returns_400(client, seed):
+    intern = seed.user("intern")
+    headers = seed.headers(intern)
+    for cursor in ("not base64!", "bm9wZQ==", "djI6MTA=", "djE6YWJj"):  # garbage, "nope", "v2:10", "v1:abc"
+        response = client.get("/logs/changes", params={"since": cursor}, headers=headers)
+        assert response.status_code == 400, cursor
+        assert response.json()["detail"] == "Invalid sync cursor"
+
+
+def test_cursor_ahead_of_server_returns_410(client, seed):
+    intern = seed.user("intern")
+    headers = seed.headers(intern)
+    seed.logs(intern, 3)
+    cursor = sync(client, headers)["cursor"]
+
+    # the database is re-initialized and the change counter starts over
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    intern = seed.user("intern")
+    seed.logs(intern, 1)
+
+    response = client.get("/logs/changes", params={"since": cursor}, headers=headers)
+    assert response.status_code == 410
+    assert response.json()["detail"] == "Sync cursor is ahead of the server; do a full sync"
+
+    full = sync(client, headers)
+    assert len(full["logs"]) == 1
+
+
+def test_full_sync_has_no_deletions(client, seed):
+    intern = seed.user("intern")
+    headers = seed.headers(intern)
+    kept, deleted = seed.logs(intern, 2)
+    client.delete(f"/logs/{deleted.id}", headers=headers)
+
+    full = sync(client, headers)
+    assert [log["id"] for log in full["logs"]] == [kept.id]
+    assert full["deleted"] == []
+
+
+def test_delete_log_by_non_owner_is_forbidden(client, seed):
+    owner = seed.user("owner")
+    other = seed.user("other")
+    supervisor = seed.user("supervisor", role="supervisor")
+    log = seed.logs(owner, 1)[0]
+
+    for user in (other, supervisor):
+        response = client.delete(f"/logs/{log.id}", headers=seed.headers(user))
+        assert response.status_code == 403
+
+    assert [l["id"] for l in sync(client, seed.headers(owner))["logs"]] == [log.id]
+
+
+def test_delete_unknown_log_returns_404(client, seed):
+    intern = seed.user("intern")
+    response = client.delete("/logs/999", headers=seed.headers(intern))
+    assert response.status_code == 404
@@ -0,0 +1,264 @@
+"""Query-count and latency budgets for every endpoint in routers/logs.py and routers/users.py.
+
+Each endpoint declares the most SQL statements, fetched rows and wall time it
+may use at a given data size. List endpoints are also run at two sizes to make
+sure the statement count does not grow with the result (N+1 detection).
+"""
+import pytest
+
+# Seeded rows for the list endpoints
+DATA_SIZE = 50
+
+# Wall time budgets in ms; bcrypt hashing dominates register and login
+FAST_MS = 250
+BCRYPT_MS = 1500
+
+# Statement and row budgets equal the measured counts, with no slack, so a
+# single extra query fails the suite. query_budget also fails when an endpoint
+# uses fewer than its budget, so improvements get locked in.
+BUDGETS = {
+    # routers/logs.py
+    "POST /logs/": dict(statements=4, rows=3, ms=FAST_MS),
+    "GET /logs/": dict(statements=2, rows=DATA_SIZE + 1, ms=FAST_MS),
+    "PUT /logs/{log_id} (owner)": dict(statements=5, rows=4, ms=FAST_MS),
+    "PUT /logs/{log_id} (supervisor)": dict(statements=5, rows=4, ms=FAST_MS),
+    "GET /logs/changes": dict(statements=4, rows=DATA_SIZE + 3, ms=FAST_MS),
+    "DELETE /logs/{log_id}": dict(statements=5, rows=3, ms=FAST_MS),
+    "GET /logs/{log_id}/history": dict(statements=4, rows=DATA_SIZE + 2, ms=FAST_MS),
+    # routers/users.py
+    "POST /register": dict(statements=4, rows=1, ms=BCRYPT_MS),
+    "POST /login": dict(statements=1, rows=1, ms=BCRYPT_MS),
+    "GET /me": dict(statements=1, rows=1, ms=FAST_MS),
+    "GET /users": dict(statements=2, rows=DATA_SIZE + 2, ms=FAST_MS),
+    "PUT /users/{user_id}": dict(statements=4, rows=3, ms=FAST_MS),
+    "DELETE /users/{user_id}": dict(statements=3, rows=2, ms=FAST_MS),
+}
+
+LOG_PAYLOAD = {
+    "day": "Monday",
+    "date": "2024-03-18",
+    "week_number": 1,
+    "working_hours": 8,
+    "task_description": "Completed feature X",
+    "status": "pending",
+}
+
+
+def test_every_route_has_a_budget():
+    from app.routers import logs, users
+
+    routes = {
+        f"{method} {route.path}"
+        for router in (logs.router, users.router)
+        for route in router.routes
+        for method in route.methods
+    }
+    declared = {name.split(" (")[0] for name in BUDGETS}
+    assert routes <= declared, f"Endpoints without a budget: {sorted(routes - declared)}"
+
+
+# ============ routers/logs.py ============
+
+def test_create_log(client, seed, query_budget):
+    intern = seed.user("intern")
+    headers = seed.headers(intern)
+    with query_budget(**BUDGETS["POST /logs/"]):
+        response = client.post("/logs/", json=LOG_PAYLOAD, headers=headers)
+    assert response.status_code == 200
+
+
+def test_get_my_logs(client, seed, query_budget):
+    intern = seed.user("intern")
+    seed.logs(intern, DATA_SIZE)
+    headers = seed.headers(intern)
+    with query_budget(**BUDGETS["GET /logs/"]):
+        response = client.get("/logs/", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == DATA_SIZE
+
+
+def test_update_log_as_owner(client, seed, query_budget):
+    intern = seed.user("intern")
+    log = seed.logs(intern, 1)[0]
+    headers = seed.headers(intern)
+    with query_budget(**BUDGETS["PUT /logs/{log_id} (owner)"]):
+        response = client.put(f"/logs/{log.id}", json={"task_description": "Updated"}, headers=headers)
+    assert response.status_code == 200
+
+
+def test_update_log_as_supervisor(client, seed, query_budget):
+    intern = seed.user("intern")
+    supervisor = seed.user("supervisor", role="supervisor")
+    log = seed.logs(intern, 1)[0]
+    headers = seed.headers(supervisor)
+    with query_budget(**BUDGETS["PUT /logs/{log_id} (supervisor)"]):
+        response = client.put(f"/logs/{log.id}", json={"status": "approved"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "approved"
+
+
+def test_get_log_changes(client, seed, query_budget):
+    intern = seed.user("intern")
+    headers = seed.headers(intern)
+    cursor = client.get("/logs/changes", headers=headers).json()["cursor"]
+    logs = seed.logs(intern, DATA_SIZE + 1)
+    client.delete(f"/logs/{logs[0].id}", headers=headers)
+    with query_budget(**BUDGETS["GET /logs/changes"]):
+        response = client.get("/logs/changes", params={"since": cursor}, headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()["logs"]) == DATA_SIZE
+    assert response.json()["deleted"] == [logs[0].id]
+
+
+def test_delete_log(client, seed, query_budget):
+    intern = seed.user("intern")
+    log = seed.logs(intern, 1)[0]
+    headers = seed.headers(intern)
+    with query_budget(**BUDGETS["DELETE /logs/{log_id}"]):
+        response = client.delete(f"/logs/{log.id}", headers=headers)
+    assert response.status_code == 200
+
+
+def test_get_log_history(client, seed, query_budget):
+    intern = seed.user("intern")
+    log = seed.logs(intern, 1)[0]
+    headers = seed.headers(intern)
+    for i in range(DATA_SIZE):
+        client.put(f"/logs/{log.id}", json={"task_description": f"Edit {i}"}, headers=headers)
+    with query_budget(**BUDGETS["GET /logs/{log_id}/history"]):
+        response = client.get(f"/logs/{log.id}/history", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == DATA_SIZE
+
+
+# ============ routers/users.py ============
+
+def test_register(client, query_budget):
+    payload = {"email": "new@example.com", "username": "new", "password": "password123"}
+    with query_budget(**BUDGETS["POST /register"]):
+        response = client.post("/register", json=payload)
+    assert response.status_code == 200
+
+
+def test_login(client, seed, query_budget):
+    intern = seed.user("intern")
+    with query_budget(**BUDGETS["POST /login"]):
+        response = client.post("/login", json={"email": intern.email, "password": seed.password})
+    assert response.status_code == 200
+
+
+def test_read_users_me(client, seed, query_budget):
+    intern = seed.user("intern")
+    headers = seed.headers(intern)
+    with query_budget(**BUDGETS["GET /me"]):
+        response = client.get("/me", headers=headers)
+    assert response.status_code == 200
+
+
+def test_get_all_users(client, seed, query_budget):
+    admin = seed.user("admin", role="admin")
+    seed.users(DATA_SIZE)
+    headers = seed.headers(admin)
+    with query_budget(**BUDGETS["GET /users"]):
+        response = client.get("/users", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == DATA_SIZE + 1
+
+
+def test_update_user(client, seed, query_budget):
+    admin = seed.user("admin", role="admin")
+    intern = seed.user("intern")
+    headers = seed.headers(admin)
+    with query_budget(**BUDGETS["PUT /users/{user_id}"]):
+        response = client.put(f"/users/{intern.id}", json={"role": "supervisor"}, headers=headers)
+    assert response.status_code == 200
+
+
+def test_delete_user(client, seed, query_budget):
+    admin = seed.user("admin", role="admin")
+    intern = seed.user("intern")
+    headers = seed.headers(admin)
+    with query_budget(**BUDGETS["DELETE /users/{user_id}"]):
+        response = client.delete(f"/users/{intern.id}", headers=headers)
+    assert response.status_code == 200
+
+
+# ============ N+1 detection ============
+
+def _list_my_logs(client, seed, size):
+    intern = seed.user(f"intern{size}")
+    seed.logs(intern, size)
+    headers = seed.headers(intern)
+    return lambda: client.get("/logs/", headers=headers)
+
+
+def _list_users(client, seed, size):
+    admin = seed.user(f"admin{size}", role="admin")
+    seed.users(size, prefix=f"user{size}_")
+    headers = seed.headers(admin)
+    return lambda: client.get("/users", headers=headers)
+
+
+def _log_changes(client, seed, size):
+    supervisor = seed.user(f"supervisor{size}", role="supervisor")
+    intern = seed.user(f"intern{size}")
+    headers = seed.headers(supervisor)
+    cursor = client.get("/logs/changes", headers=headers).json()["cursor"]
+    logs = seed.logs(intern, size)
+    for log in logs[:size // 2]:
+        client.delete(f"/logs/{log.id}", headers=seed.headers(intern))
+    return lambda: client.get("/logs/changes", params={"since": cursor}, headers=headers)
+
+
+def _log_history(client, seed, size):
+    intern = seed.user(f"intern{size}")
+    log = seed.logs(intern, 1)[0]
+    headers = seed.headers(intern)
+    for i in range(size):
+        client.put(f"/logs/{log.id}", json={"task_description": f"Edit {i}"}, headers=headers)
+    client.get(f"/logs/{log.id}/history", headers=headers)  # flush the audit buffer
+    return lambda: client.get(f"/logs/{log.id}/history", headers=headers)
+
+
+@pytest.mark.parametrize("setup", [_list_my_logs, _list_users, _log_changes, _log_history])
+def test_statement_count_does_not_grow_with_result_size(client, seed, measure, setup):
+    counts = {}
+    for size in (5, DATA_SIZE):
+        request = setup(client, seed, size)
+        with measure() as result:
+            response = request()
+        assert response.status_code == 200
+        counts[size] = result["statements"]
+    assert counts[5] == counts[DATA_SIZE], (
+        f"{setup.__name__}: statement count grew from {counts[5]} to {counts[DATA_SIZE]} "
+        f"with result size (N+1 query?)"
+    )
+
+
+# ============ app/bulk_register.py ============
+
+@pytest.mark.xfail(
+    strict=True,
+    reason="bulk_register_users runs two SELECTs per user to check email/username "
+           "and refreshes each created user one by one"
+)
+def test_bulk_register_statement_count_does_not_grow_with_batch_size(seed, measure, monkeypatch):
+    from app import bulk_register, schemas
+
+    # bcrypt would dominate the run; the statement count is what matters here
+    monkeypatch.setattr(bulk_register, "get_password_hash", lambda password: seed.password)
+
+    counts = {}
+    for size in (5, DATA_SIZE):
+        users = [
+            schemas.UserCreate(email=f"bulk{size}_{i}@example.com", username=f"bulk{size}_{i}", password=seed.password)
+            for i in range(size)
+        ]
+        with measure() as result:
+            created = bulk_register.bulk_register_users(seed.db, users)
+        assert len(created) == size
+        counts[size] = result["statements"]
+    assert counts[5] == counts[DATA_SIZE], (
+        f"bulk_register_users: statement count grew from {counts[5]} to {counts[DATA_SIZE]} "
+        f"with batch size (N+1 query?)"
+    )